@@ -1,19 +1,33 @@
-from typing import List
+from array import array
+from typing import Iterator, List, Tuple
 from maze.util import Coordinates
 from maze.graph import Graph
 
 class EdgeListGraph(Graph):
     """
     Represents an undirected graph using an edge list. 
-    Each edge is stored as a tuple of two vertices (Coordinates) and a boolean indicating the presence of a wall.
+    The edge list is stored column-wise: edge i goes from edge_v1[i] to edge_v2[i] and has wall status edge_walls[i].
+    Edges are undirected, so they are stored in canonical order with edge_v1[i] < edge_v2[i].
+    Vertices are interned to integer ids, so the edge list only holds ints and comparing endpoints is a plain integer compare.
+    A dictionary indexes the edge list by its canonical endpoint pair, so edge queries are dictionary lookups rather than scans.
     This implementation allows for the addition, removal, and querying of vertices and edges, as well as updating wall statuses between vertices.
     """
 
     def __init__(self):
-        # List to store edges where each edge is represented as a tuple (vert1, vert2, wallStatus)
-        self.edges: List[tuple[Coordinates, Coordinates, bool]] = []
-        # Set to store unique vertices
-        self.vertices: set[Coordinates] = set()
+        # Parallel arrays storing the edges, where edge i is (edge_v1[i], edge_v2[i]) with wall status edge_walls[i]
+        # The endpoints are stored as vertex ids, smaller id first
+        self.edge_v1: array = array('q')
+        self.edge_v2: array = array('q')
+        # Wall statuses are stored one byte per edge (1 if there is a wall, 0 otherwise)
+        self.edge_walls: bytearray = bytearray()
+        # Dictionary to store unique vertices with their id
+        self.vertices: dict[Coordinates, int] = {}
+        # Vertex labels indexed by id, the reverse of self.vertices
+        self._coord: List[Coordinates] = []
+        # Index of each edge in the edge list, keyed by its canonical (edge_v1, edge_v2) pair
+        self.edge_index: dict[tuple[int, int], int] = {}
+        # Adjacency lists indexed by vertex id, holding the ids of the neighbours
+        self.adj: List[List[int]] = []
 
 
     def addVertex(self, label: Coordinates):
@@ -21,16 +35,24 @@ class EdgeListGraph(Graph):
         Adds a vertex to the graph.
         If the vertex already exists, this method does nothing.
         """
-        self.vertices.add(label)
+        if not self.hasVertex(label):
+            # Assign the next id to the vertex
+            self.vertices[label] = len(self._coord)
+            self._coord.append(label)
+            self.adj.append([])
 
 
     def addVertices(self, vertLabels: List[Coordinates]):
         """
         Adds multiple vertices to the graph.
-        Iterates through the list of vertices and adds each one individually.
+        Vertices that already exist (or are repeated in the list) are only added once.
+        The new vertices are assigned consecutive ids and inserted in bulk.
         """
-        for label in vertLabels:
-            self.addVertex(label)
+        newLabels = [label for label in dict.fromkeys(vertLabels) if label not in self.vertices]
+        start = len(self._coord)
+        self.vertices.update(zip(newLabels, range(start, start + len(newLabels))))
+        self._coord.extend(newLabels)
+        self.adj.extend([] for _ in newLabels)
 
 
     def addEdge(self, vert1: Coordinates, vert2: Coordinates, addWall: bool = False) -> bool:
@@ -42,12 +64,22 @@ class EdgeListGraph(Graph):
         Returns True if the edge was added, False otherwise.
         """
         # Check if both vertices exist in the graph
-        if not self.hasVertex(vert1) or not self.hasVertex(vert2):
+        a = self.vertices.get(vert1)
+        b = self.vertices.get(vert2)
+        if a is None or b is None:
             return False
         
-        # Add the edge if it doesn't already exist
-        if not self.hasEdge(vert1, vert2):
-            self.edges.append((vert1, vert2, addWall))
+        # Add the edge if it doesn't already exist, probing the edge index only once
+        a, b = self._canonical(a, b)
+        if (a, b) not in self.edge_index:
+            self.edge_index[(a, b)] = len(self.edge_v1)
+            self.adj[a].append(b)
+            # A self-loop is only listed once
+            if a != b:
+                self.adj[b].append(a)
+            self.edge_v1.append(a)
+            self.edge_v2.append(b)
+            self.edge_walls.append(1 if addWall else 0)
             return True
         
         return False
@@ -59,13 +91,13 @@ class EdgeListGraph(Graph):
         If the edge exists, updates its wall status and returns True.
         Returns False if the edge does not exist.
         """
-        for i, (v1, v2, _) in enumerate(self.edges):
-            if (v1 == vert1 and v2 == vert2) or (v1 == vert2 and v2 == vert1):
-                # Update the wall status in the edge list
-                self.edges[i] = (v1, v2, wallStatus)
-                return True
-            
-        return False
+        i = self._findEdge(vert1, vert2)
+        if i == -1:
+            return False
+
+        # Update the wall status in the edge list
+        self.edge_walls[i] = 1 if wallStatus else 0
+        return True
 
 
     def removeEdge(self, vert1: Coordinates, vert2: Coordinates) -> bool:
@@ -73,14 +105,32 @@ class EdgeListGraph(Graph):
         Removes an edge between two vertices.
         If the edge exists, it is removed and the method returns True.
         Returns False if the edge does not exist.
+        The last edge is moved into the removed edge's slot, so the order of the edge list is not stable.
         """
-        for i, (v1, v2, _) in enumerate(self.edges):
-            if (v1 == vert1 and v2 == vert2) or (v1 == vert2 and v2 == vert1):
-                # Remove the edge from the list
-                self.edges.pop(i)
-                return True
-            
-        return False
+        i = self._findEdge(vert1, vert2)
+        if i == -1:
+            return False
+
+        # Remove the edge from the index and the adjacency lists
+        a, b = self.edge_v1[i], self.edge_v2[i]
+        del self.edge_index[(a, b)]
+        self.adj[a].remove(b)
+        # A self-loop is only listed once
+        if a != b:
+            self.adj[b].remove(a)
+
+        # Move the last edge into the freed slot and re-point its index entry
+        last = len(self.edge_v1) - 1
+        if i != last:
+            a, b = self.edge_v1[last], self.edge_v2[last]
+            self.edge_v1[i], self.edge_v2[i], self.edge_walls[i] = a, b, self.edge_walls[last]
+            self.edge_index[(a, b)] = i
+
+        self.edge_v1.pop()
+        self.edge_v2.pop()
+        self.edge_walls.pop()
+
+        return True
 
 
     def hasVertex(self, label: Coordinates) -> bool:
@@ -96,7 +146,7 @@ class EdgeListGraph(Graph):
         Checks if an edge exists between two vertices.
         Returns True if the edge exists, False otherwise.
         """
-        return any((v1 == vert1 and v2 == vert2) or (v2 == vert1 and v1 == vert2) for v1, v2, _ in self.edges)
+        return self._findEdge(vert1, vert2) != -1
 
 
     def getWallStatus(self, vert1: Coordinates, vert2: Coordinates) -> bool:
@@ -104,25 +154,67 @@ class EdgeListGraph(Graph):
         Retrieves the wall status of an edge between two vertices.
         Returns the wall status if the edge exists, otherwise returns False.
         """
-        for v1, v2, wallStatus in self.edges:
-            if (v1 == vert1 and v2 == vert2) or (v1 == vert2 and v2 == vert1):
-                return wallStatus
-            
-        return False
+        i = self._findEdge(vert1, vert2)
+        if i == -1:
+            return False
 
+        return bool(self.edge_walls[i])
 
-    def neighbours(self, label: Coordinates) -> List[Coordinates]:
+
+    def getWallStatuses(self, pairs: List[Tuple[Coordinates, Coordinates]]) -> List[bool]:
         """
-        Returns a list of all vertices that are connected to the given vertex by an edge.
+        Retrieves the wall statuses of the edges between many pairs of vertices in one call.
+        Returns a list with the wall status of each pair, in order; pairs that are not edges get False.
         """
-        neighbours = []
-        
-        # Iterate through the edges to find all neighbours of the given vertex
-        for v1, v2, _ in self.edges:
-            # Check if the vertex is the same as the given vertex
-            if v1 == label:
-                neighbours.append(v2)
-            elif v2 == label:
-                neighbours.append(v1)
-                
-        return neighbours
+        statuses = []
+        for vert1, vert2 in pairs:
+            i = self._findEdge(vert1, vert2)
+            statuses.append(i != -1 and bool(self.edge_walls[i]))
+
+        return statuses
+
+
+    def neighbours(self, label: Coordinates) -> Iterator[Coordinates]:
+        """
+        Returns an iterator over all vertices that are connected to the given vertex by an edge.
+        The edges of the vertex should not be added or removed while iterating.
+        """
+        if not self.hasVertex(label):
+            return iter(())
+
+        # Translate the neighbour ids back to their labels
+        return map(self._coord.__getitem__, self.adj[self.vertices[label]])
+
+
+    def neighboursWithWalls(self, label: Coordinates) -> Iterator[Tuple[Coordinates, bool]]:
+        """
+        Returns an iterator over (neighbour, wall status) pairs for all vertices connected to the given vertex by an edge.
+        Saves looking up each neighbour's edge again with getWallStatus() after neighbours().
+        The edges of the vertex should not be added or removed while iterating.
+        """
+        if not self.hasVertex(label):
+            return iter(())
+
+        index = self.vertices[label]
+        return ((self._coord[n], bool(self.edge_walls[self.edge_index[self._canonical(index, n)]])) for n in self.adj[index])
+
+
+    def _findEdge(self, vert1: Coordinates, vert2: Coordinates) -> int:
+        """
+        Finds the index of the edge between two vertices.
+        Returns the index of the edge, or -1 if either vertex or the edge does not exist.
+        """
+        a = self.vertices.get(vert1)
+        b = self.vertices.get(vert2)
+        if a is None or b is None:
+            return -1
+
+        return self.edge_index.get(self._canonical(a, b), -1)
+
+
+    @staticmethod
+    def _canonical(a: int, b: int) -> tuple[int, int]:
+        """
+        Orders the two vertex ids of an undirected edge, smaller id first.
+        """
+        return (a, b) if a < b else (b, a)
@@ -7,7 +7,7 @@
 # -------------------------------------------------
 
 
-from typing import List
+from typing import Iterator, List
 
 from maze.util import Coordinates
 
@@ -117,13 +117,13 @@ class Graph:
 
 
 
-    def neighbours(self, label:Coordinates)->List[Coordinates]:
+    def neighbours(self, label:Coordinates)->Iterator[Coordinates]:
         """
         Retrieves all the neighbours of vertex/label.
 
         @param label: Label of vertex to obtain neighbours.
         
-        @returns List of neighbouring vertices.  Returns empty list if no neighbours.
+        @returns Iterator over neighbouring vertices.  Yields nothing if no neighbours.
         """
         pass
 
@@ -7,7 +7,7 @@
 # ------------------------------------------------------------------------
 
 
-from typing import List
+from typing import Iterator
 
 from maze.maze import Maze
 from maze.util import Coordinates
@@ -70,13 +70,8 @@ class GraphMaze(Maze):
         # checks if coordinates are valid
         assert(self.checkCoordinates(cell1) and self.checkCoordinates(cell2))
 
-        # only can add wall if adjacent
-        if self.m_graph.hasEdge(cell1, cell2):
-            self.m_graph.updateWall(cell1, cell2, True)
-            return True
-        
-        # in all other cases, we return False
-        return False
+        # only can add wall if adjacent, in all other cases updateWall() fails and returns False
+        return self.m_graph.updateWall(cell1, cell2, True)
 
 
 
@@ -86,13 +81,8 @@ class GraphMaze(Maze):
         # checks if coordinates are valid
         assert(self.checkCoordinates(cell1) and self.checkCoordinates(cell2))
 
-        # only can remove wall if adjacent
-        if self.m_graph.hasEdge(cell1, cell2):
-            self.m_graph.updateWall(cell1, cell2, False)
-            return True
-        
-        # in all other cases, we return False
-        return False
+        # only can remove wall if adjacent, in all other cases updateWall() fails and returns False
+        return self.m_graph.updateWall(cell1, cell2, False)
 
 
 
@@ -101,7 +91,7 @@ class GraphMaze(Maze):
 
 
 
-    def neighbours(self, cell:Coordinates)->List[Coordinates]:
+    def neighbours(self, cell:Coordinates)->Iterator[Coordinates]:
         return self.m_graph.neighbours(cell)
 
 
@@ -1,4 +1,5 @@
-from typing import List
+from array import array
+from typing import Iterator, List, Tuple
 from maze.util import Coordinates
 from maze.graph import Graph
 
@@ -6,37 +7,52 @@ class IncMatGraph(Graph):
     """
     Represents an undirected graph using an incidence matrix.
     The incidence matrix tracks the connections between vertices (Coordinates) and edges.
+    As each column only has two non-zero entries, which are exactly the endpoints of the edge, the matrix is not stored: it is fully described by the edges and is materialised on demand by incidence_mat.
+    Vertices are interned to integer ids (their row in the matrix), so the edges only hold ints and comparing endpoints is a plain integer compare.
+    Edges are undirected, so they are stored in canonical order with edge_v1[i] < edge_v2[i], and indexed by that pair for constant time lookup.
     This implementation allows for the addition, removal, and querying of vertices and edges, as well as updating wall statuses between vertices.
     """
 
     def __init__(self):
-        # Dictionary to store vertices with their index in the incidence matrix
+        # Dictionary to store vertices with their index (id) in the incidence matrix
         self.vertices: dict[Coordinates, int] = {}
-        # List to store edges where each edge is represented as a tuple (vert1, vert2, wallStatus)
-        self.edges: List[tuple[Coordinates, Coordinates, bool]] = []
-        # Incidence matrix where each row corresponds to a vertex and each column corresponds to an edge
-        self.incidence_mat: List[List[int]] = []
+        # Vertex labels indexed by id, the reverse of self.vertices
+        self._coord: List[Coordinates] = []
+        # Parallel arrays storing the edges, where edge i is (edge_v1[i], edge_v2[i]) with wall status edge_walls[i]
+        # The endpoints are stored as vertex ids, smaller id first
+        self.edge_v1: array = array('q')
+        self.edge_v2: array = array('q')
+        # Wall statuses are stored one byte per edge (1 if there is a wall, 0 otherwise)
+        self.edge_walls: bytearray = bytearray()
+        # Index (column) of each edge, keyed by its canonical (edge_v1, edge_v2) pair
+        self.edge_index: dict[tuple[int, int], int] = {}
+        # Neighbour lists indexed by vertex id, holding the ids of the neighbours
+        self.neighbour_lists: List[List[int]] = []
 
 
     def addVertex(self, label: Coordinates):
         """
         Adds a vertex to the graph.
         If the vertex already exists, this method does nothing.
-        Updates the incidence matrix to reflect the new vertex.
         """
         if not self.hasVertex(label):
-            # Assign a new index to the vertex and add a corresponding row to the incidence matrix
-            self.vertices[label] = len(self.vertices)
-            self.incidence_mat.append([0] * len(self.edges))
+            # Assign a new index (row of the incidence matrix) to the vertex
+            self.vertices[label] = len(self._coord)
+            self._coord.append(label)
+            self.neighbour_lists.append([])
 
 
     def addVertices(self, vertLabels: List[Coordinates]):
         """
         Adds multiple vertices to the graph.
-        Iterates through the list of vertices and adds each one individually.
+        Vertices that already exist (or are repeated in the list) are only added once.
+        The new vertices are assigned consecutive ids and inserted in bulk.
         """
-        for label in vertLabels:
-            self.addVertex(label)
+        newLabels = [label for label in dict.fromkeys(vertLabels) if label not in self.vertices]
+        start = len(self._coord)
+        self.vertices.update(zip(newLabels, range(start, start + len(newLabels))))
+        self._coord.extend(newLabels)
+        self.neighbour_lists.extend([] for _ in newLabels)
 
 
     def addEdge(self, vert1: Coordinates, vert2: Coordinates, addWall: bool = False) -> bool:
@@ -47,24 +63,27 @@ class IncMatGraph(Graph):
         Returns True if the edge was added, False otherwise.
         """
         # Check if both vertices exist in the graph
-        if vert1 not in self.vertices or vert2 not in self.vertices:
+        a = self.vertices.get(vert1)
+        b = self.vertices.get(vert2)
+        if a is None or b is None:
             return False
         
         # Check if the edge already exists
-        if self.hasEdge(vert1, vert2):
+        a, b = self._canonical(a, b)
+        if (a, b) in self.edge_index:
             return False
         
         # Add the edge to the list
-        self.edges.append((vert1, vert2, addWall))
+        self.edge_v1.append(a)
+        self.edge_v2.append(b)
+        self.edge_walls.append(1 if addWall else 0)
         
-        # Update the incidence matrix with the new edge
-        for row in self.incidence_mat:
-            row.append(0)  # Add a new column for the new edge
-        
-        # Connect the vertices in the incidence matrix
-        index = len(self.edges) - 1  # Index of the new edge
-        self.incidence_mat[self.vertices[vert1]][index] = 1
-        self.incidence_mat[self.vertices[vert2]][index] = 1
+        # Connect the vertices
+        self.edge_index[(a, b)] = len(self.edge_v1) - 1
+        self.neighbour_lists[a].append(b)
+        # A self-loop is only listed once
+        if a != b:
+            self.neighbour_lists[b].append(a)
         
         # If successful, return True
         return True
@@ -77,32 +96,61 @@ class IncMatGraph(Graph):
         Returns False if the edge does not exist.
         """
         # Find the edge and update its wall status
-        for i, (v1, v2, _) in enumerate(self.edges):
-            if (v1 == vert1 and v2 == vert2) or (v1 == vert2 and v2 == vert1):
-                self.edges[i] = (v1, v2, wallStatus)
-                return True
-            
-        return False
+        i = self._findEdge(vert1, vert2)
+        if i == -1:
+            return False
+
+        self.edge_walls[i] = 1 if wallStatus else 0
+        return True
 
 
     def removeEdge(self, vert1: Coordinates, vert2: Coordinates) -> bool:
         """
         Removes an edge between two vertices.
-        If the edge exists, it is removed, and the incidence matrix is updated accordingly.
+        If the edge exists, it is removed.
         Returns True if the edge was removed, False otherwise.
+        The last edge (column) is moved into the removed edge's slot, so the order of the edges is not stable.
         """
-        # Find and remove the edge from the list
-        for i, (v1, v2, _) in enumerate(self.edges):
-            if (v1 == vert1 and v2 == vert2) or (v2 == vert1 and v1 == vert2):
-                self.edges.pop(i)
-                
-                # Remove the corresponding column from the incidence matrix
-                for row in self.incidence_mat:
-                    row.pop(i)
-                
-                return True
-            
-        return False
+        # Find the edge
+        i = self._findEdge(vert1, vert2)
+        if i == -1:
+            return False
+
+        # Disconnect the vertices
+        a, b = self.edge_v1[i], self.edge_v2[i]
+        del self.edge_index[(a, b)]
+        self.neighbour_lists[a].remove(b)
+        # A self-loop is only listed once
+        if a != b:
+            self.neighbour_lists[b].remove(a)
+
+        # Move the last edge into the freed slot and re-point its index entry
+        last = len(self.edge_v1) - 1
+        if i != last:
+            a, b = self.edge_v1[last], self.edge_v2[last]
+            self.edge_v1[i], self.edge_v2[i], self.edge_walls[i] = a, b, self.edge_walls[last]
+            self.edge_index[(a, b)] = i
+
+        self.edge_v1.pop()
+        self.edge_v2.pop()
+        self.edge_walls.pop()
+
+        return True
+
+
+    @property
+    def incidence_mat(self) -> List[List[int]]:
+        """
+        Builds the (dense) incidence matrix of the graph.
+        Row r corresponds to the vertex with index r in self.vertices and column i to edge i; entries are 1 where the vertex is an endpoint of the edge, 0 otherwise.
+        The matrix is rebuilt on every access and is not updated as the graph changes.
+        """
+        matrix = [[0] * len(self.edge_v1) for _ in self._coord]
+        for i, (a, b) in enumerate(zip(self.edge_v1, self.edge_v2)):
+            matrix[a][i] = 1
+            matrix[b][i] = 1
+
+        return matrix
 
 
     def hasVertex(self, label: Coordinates) -> bool:
@@ -118,7 +166,7 @@ class IncMatGraph(Graph):
         Checks if an edge exists between two vertices.
         Returns True if the edge exists, False otherwise.
         """
-        return any((v1 == vert1 and v2 == vert2) or (v1 == vert2 and v2 == vert1) for v1, v2, _ in self.edges)
+        return self._findEdge(vert1, vert2) != -1
 
 
     def getWallStatus(self, vert1: Coordinates, vert2: Coordinates) -> bool:
@@ -126,28 +174,67 @@ class IncMatGraph(Graph):
         Retrieves the wall status of an edge between two vertices.
         Returns the wall status if the edge exists, otherwise returns False.
         """
-        for v1, v2, status in self.edges:
-            if (v1 == vert1 and v2 == vert2) or (v2 == vert1 and v1 == vert2):
-                return status
-        return False
+        i = self._findEdge(vert1, vert2)
+        if i == -1:
+            return False
+
+        return bool(self.edge_walls[i])
 
 
-    def neighbours(self, label: Coordinates) -> List[Coordinates]:
+    def getWallStatuses(self, pairs: List[Tuple[Coordinates, Coordinates]]) -> List[bool]:
         """
-        Returns a list of all vertices that are connected to the given vertex by an edge.
+        Retrieves the wall statuses of the edges between many pairs of vertices in one call.
+        Returns a list with the wall status of each pair, in order; pairs that are not edges get False.
         """
-        neighbours = []
-        
-        if self.hasVertex(label):
-            index = self.vertices[label]  # Get the vertex index
-            
-            # Iterate over the edges and find connected vertices
-            for i, (v1, v2, _) in enumerate(self.edges):                
-                if self.incidence_mat[index][i] == 1:
-                    # Avoid adding the vertex itself
-                    if v1 == label:
-                        neighbours.append(v2)
-                    else:   
-                        neighbours.append(v1)
-                
-        return neighbours
\ No newline at end of file
+        statuses = []
+        for vert1, vert2 in pairs:
+            i = self._findEdge(vert1, vert2)
+            statuses.append(i != -1 and bool(self.edge_walls[i]))
+
+        return statuses
+
+
+    def neighbours(self, label: Coordinates) -> Iterator[Coordinates]:
+        """
+        Returns an iterator over all vertices that are connected to the given vertex by an edge.
+        The edges of the vertex should not be added or removed while iterating.
+        """
+        if not self.hasVertex(label):
+            return iter(())
+
+        # Translate the neighbour ids back to their labels
+        return map(self._coord.__getitem__, self.neighbour_lists[self.vertices[label]])
+
+
+    def neighboursWithWalls(self, label: Coordinates) -> Iterator[Tuple[Coordinates, bool]]:
+        """
+        Returns an iterator over (neighbour, wall status) pairs for all vertices connected to the given vertex by an edge.
+        Saves looking up each neighbour's edge again with getWallStatus() after neighbours().
+        The edges of the vertex should not be added or removed while iterating.
+        """
+        if not self.hasVertex(label):
+            return iter(())
+
+        index = self.vertices[label]
+        return ((self._coord[n], bool(self.edge_walls[self.edge_index[self._canonical(index, n)]])) for n in self.neighbour_lists[index])
+
+
+    def _findEdge(self, vert1: Coordinates, vert2: Coordinates) -> int:
+        """
+        Finds the index (column in the incidence matrix) of the edge between two vertices.
+        Returns the index of the edge, or -1 if either vertex or the edge does not exist.
+        """
+        a = self.vertices.get(vert1)
+        b = self.vertices.get(vert2)
+        if a is None or b is None:
+            return -1
+
+        return self.edge_index.get(self._canonical(a, b), -1)
+
+
+    @staticmethod
+    def _canonical(a: int, b: int) -> tuple[int, int]:
+        """
+        Orders the two vertex ids of an undirected edge, smaller id first.
+        """
+        return (a, b) if a < b else (b, a)
\ No newline at end of file
@@ -9,21 +9,22 @@
 
 
 
-class Coordinates:
+from typing import NamedTuple
+
+
+
+
+class Coordinates(NamedTuple):
     """
     Represent coordinates for maze cells.
-    """
+    Coordinates are immutable (row, col) tuples, so equality and hashing are done by the underlying tuple.
 
-    def __init__(self, row:int, col:int):
-        """
-        Constructor.
-        
-        @param row: Row of coordinates.
-        @param col: Column of coordinates.
-        """
+    @param row: Row of coordinates.
+    @param col: Column of coordinates.
+    """
 
-        self.m_r = row
-        self.m_c = col
+    row: int
+    col: int
 
 
 
@@ -31,7 +32,7 @@ class Coordinates:
         """
         @returns Row of coordinate.
         """
-        return self.m_r
+        return self.row
     
 
 
@@ -39,7 +40,7 @@ class Coordinates:
         """
         @returns Column of coordinate.
         """
-        return self.m_c
+        return self.col
     
 
 
@@ -48,34 +49,8 @@ class Coordinates:
         """
         Determine if two coordinates are adjacent to each other.
         """
-        if (abs(self.m_r - other.getRow()) == 1 and self.m_c == other.getCol()) or\
-                (self.m_r == other.getRow() and abs(self.m_c - other.getCol()) == 1): 
+        if (abs(self.row - other.getRow()) == 1 and self.col == other.getCol()) or\
+                (self.row == other.getRow() and abs(self.col - other.getCol()) == 1): 
             return True
         else:
             return False
-        
-
-
-    def __eq__(self, other:"Coordinates"):
-        """
-        Define == operator.
-
-        @param other: Other coordinates that we are comparing with.
-        """
-        if other != None:
-            return self.m_r == other.getRow() and self.m_c == other.getCol()
-        else:
-            return False
-
-
-
-    def __hash__(self):
-        """
-        Returns has value of Coordinates.  Needed for being a key in dictionaries.
-        """
-        return hash(str(self.m_r)+'|'+str(self.m_c))
-        
-        
-    
-
-